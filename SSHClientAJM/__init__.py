@@ -1 +1,6 @@
-from SSHClientAJM.SSHClientAJM import SSHClient
\ No newline at end of file
+from SSHClientAJM.SSHClientAJM import SSHClient, ssh_connect_interactive
+
+try:
+    from SSHClientAJM.async_client import AsyncSSHClient
+except ImportError:  # asyncssh is an optional dependency
+    AsyncSSHClient = None
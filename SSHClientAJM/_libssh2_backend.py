@@ -0,0 +1,177 @@
+"""
+_libssh2_backend.py
+
+Optional libssh2-based backend for SSHClientAJM, built on the ``ssh2-python``
+bindings. libssh2 performs the SSH handshake, crypto, and channel I/O in C,
+which makes connection setup and bulk data transfer considerably faster than
+the pure-Python Paramiko path.
+
+The classes here mirror the small subset of the ``paramiko.SSHClient`` /
+``paramiko.Channel`` surface that ``SSHClient`` actually uses, so the main
+class can swap backends without changing its public API. ``ssh2-python`` is
+an optional dependency; importing this module without it installed is safe,
+and ``HAS_LIBSSH2`` reports availability.
+"""
+import socket
+
+try:
+    import ssh2.session
+    HAS_LIBSSH2 = True
+except ImportError:
+    HAS_LIBSSH2 = False
+
+
+class LibSSH2Channel:
+    """
+    Wraps an ``ssh2.channel.Channel`` to look like the subset of
+    ``paramiko.Channel`` used by ``SSHClient`` (``recv``, ``send``,
+    ``sendall``, ``fileno``, ``close``).
+
+    The readiness probes the streaming loops rely on (``recv_ready``,
+    ``exit_status_ready``) have no blocking-mode equivalent in libssh2, so
+    they are deliberately absent; ``SSHClient`` rejects the interactive
+    streaming paths on this backend up front.
+
+    :ivar _channel: The underlying libssh2 channel.
+    :ivar _sock: The TCP socket the SSH session runs over.
+    """
+
+    def __init__(self, channel, sock):
+        self._channel = channel
+        self._sock = sock
+
+    def recv(self, nbytes: int = 65536) -> bytes:
+        """
+        Reads up to ``nbytes`` from the channel's stdout stream.
+
+        :param nbytes: Maximum number of bytes to read.
+        :type nbytes: int
+        :return: The bytes read, or an empty bytes object at EOF.
+        :rtype: bytes
+        """
+        size, data = self._channel.read(nbytes)
+        if size > 0:
+            return data
+        return b''
+
+    def send(self, data) -> int:
+        """
+        Writes data to the channel, returning the number of bytes written.
+
+        :param data: The data to send; ``str`` input is UTF-8 encoded.
+        :return: Number of bytes written.
+        :rtype: int
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        return self._channel.write(data)
+
+    def sendall(self, data):
+        """
+        Writes all of ``data`` to the channel, looping over short writes.
+
+        :param data: The data to send; ``str`` input is UTF-8 encoded.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        view = memoryview(data)
+        while view:
+            sent = self._channel.write(bytes(view))
+            view = view[sent:]
+
+    def fileno(self) -> int:
+        """Returns the file descriptor of the underlying TCP socket."""
+        return self._sock.fileno()
+
+    def close(self):
+        """Closes the channel."""
+        self._channel.close()
+
+
+class LibSSH2Session:
+    """
+    Wraps an ``ssh2.session.Session`` to look like the subset of
+    ``paramiko.SSHClient`` used by ``SSHClient`` (``connect``,
+    ``invoke_shell``, ``exec_command``, ``is_active``, ``close``).
+
+    :ivar _session: The underlying libssh2 session, or None before connect.
+    :ivar _sock: The TCP socket the SSH session runs over.
+    """
+
+    def __init__(self):
+        if not HAS_LIBSSH2:
+            raise ImportError("the 'libssh2' backend requires the ssh2-python package")
+        self._session = None
+        self._sock = None
+
+    def connect(self, hostname: str, port: int, username: str, password: str):
+        """
+        Opens a TCP connection, performs the SSH handshake, and authenticates
+        with the given username and password.
+
+        :param hostname: The hostname or IP address to connect to.
+        :type hostname: str
+        :param port: The SSH port.
+        :type port: int
+        :param username: The username for authentication.
+        :type username: str
+        :param password: The password for authentication.
+        :type password: str
+        """
+        self._sock = socket.create_connection((hostname, port))
+        self._session = ssh2.session.Session()
+        self._session.handshake(self._sock)
+        self._session.userauth_password(username, password)
+
+    def invoke_shell(self) -> LibSSH2Channel:
+        """
+        Opens a session channel, requests a pty, and starts a shell.
+
+        :return: A channel wrapper connected to the remote shell.
+        :rtype: LibSSH2Channel
+        """
+        channel = self._session.open_session()
+        channel.pty()
+        channel.shell()
+        return LibSSH2Channel(channel, self._sock)
+
+    def exec_command(self, command: str) -> tuple:
+        """
+        Executes a single command and drains its stdout and stderr streams.
+
+        :param command: The command to execute.
+        :type command: str
+        :return: A ``(stdout_bytes, stderr_bytes, exit_status)`` tuple.
+        :rtype: tuple
+        """
+        channel = self._session.open_session()
+        channel.execute(command)
+
+        stdout_content = bytearray()
+        size, data = channel.read()
+        while size > 0:
+            stdout_content += data
+            size, data = channel.read()
+
+        stderr_content = bytearray()
+        size, data = channel.read_stderr()
+        while size > 0:
+            stderr_content += data
+            size, data = channel.read_stderr()
+
+        channel.close()
+        channel.wait_closed()
+        return bytes(stdout_content), bytes(stderr_content), channel.get_exit_status()
+
+    def is_active(self) -> bool:
+        """Returns True while the session is connected."""
+        return self._session is not None
+
+    def close(self):
+        """Disconnects the session and closes the TCP socket."""
+        if self._session is not None:
+            self._session.disconnect()
+            self._session = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
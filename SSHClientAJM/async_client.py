@@ -0,0 +1,128 @@
+"""
+async_client.py
+
+Asyncio-based SSH client built on ``asyncssh``, for workloads that fan out to
+many hosts at once. Where ``SSHClient`` is one connection per instance (and,
+historically, one OS thread per read pump), ``AsyncSSHClient`` lets a single
+event loop drive dozens of connections, and multiple commands against one host
+share a single physical connection via asyncssh's session multiplexing.
+
+``asyncssh`` is an optional dependency; the package-level import of this
+module is guarded, so the synchronous client keeps working without it.
+"""
+import sys
+from typing import Optional
+
+import asyncssh
+
+
+class AsyncSSHClient:
+    """
+    Asynchronous SSH client for concurrent multi-host use.
+
+    One instance wraps one ``asyncssh`` connection; any number of
+    ``send_command``/``stream`` calls may run concurrently on it, sharing the
+    single transport rather than opening a new TCP + SSH handshake per call.
+
+    :ivar hostname: The hostname or IP address of the server to connect to.
+    :type hostname: str
+    :ivar port: The port number for the SSH connection; defaults to 22 if not provided.
+    :type port: int
+    :ivar username: The username for authenticating the SSH session.
+    :type username: str
+    """
+
+    def __init__(self, hostname: str, port: Optional[int] = None, **kwargs):
+        self.hostname: str = hostname
+        self.port: int = port or 22
+        self.username: Optional[str] = kwargs.get('username', None)
+        self.__password: Optional[str] = kwargs.get('password', None)
+        self._conn: Optional[asyncssh.SSHClientConnection] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._conn is not None
+
+    async def connect(self):
+        """
+        Establishes the SSH connection. Safe to call more than once; an
+        existing live connection is reused.
+
+        :return: None
+        """
+        if self._conn is not None:
+            return
+        print(f"🔌 Connecting to {self.username}@{self.hostname}:{self.port}...")
+        self._conn = await asyncssh.connect(self.hostname, port=self.port,
+                                            username=self.username,
+                                            password=self.__password,
+                                            known_hosts=None)
+        print("✅ Connected.")
+
+    async def send_command(self, command: str) -> str:
+        """
+        Executes a single command and returns its combined output. Multiple
+        calls may run concurrently; they share the one underlying connection.
+
+        :param command: The command to execute over the SSH connection.
+        :type command: str
+        :return: The command output (stdout) and error output (stderr), concatenated as a string.
+        :rtype: str
+        :raises asyncssh.Error: If the client is not connected.
+        """
+        if self._conn is None:
+            raise asyncssh.Error(code=0, reason="Not connected to the server. Call `connect()` first.")
+        result = await self._conn.run(command, check=False)
+        if result.stderr:
+            return f"STDOUT:\n{result.stdout.strip()}\n\nSTDERR:\n{result.stderr.strip()}"
+        return result.stdout.strip()
+
+    async def stream(self, command: str, chunk: int = 65536):
+        """
+        Executes a command and yields its stdout incrementally as it arrives,
+        keeping peak memory flat for arbitrarily large outputs.
+
+        :param command: The command to execute over the SSH connection.
+        :type command: str
+        :param chunk: Maximum number of bytes per yielded chunk.
+        :type chunk: int
+        :return: An async generator of output chunks.
+        :raises asyncssh.Error: If the client is not connected.
+        """
+        if self._conn is None:
+            raise asyncssh.Error(code=0, reason="Not connected to the server. Call `connect()` first.")
+        async with self._conn.create_process(command) as proc:
+            while True:
+                data = await proc.stdout.read(chunk)
+                if not data:
+                    break
+                yield data
+
+    async def interactive_shell(self):
+        """
+        Opens an interactive shell on the connection, wiring the local stdin
+        and stdout to the remote pty until the remote shell exits. asyncssh
+        handles the bidirectional forwarding on the event loop, so no helper
+        thread is needed for the read pump.
+
+        :return: None
+        :raises asyncssh.Error: If the client is not connected.
+        """
+        if self._conn is None:
+            raise asyncssh.Error(code=0, reason="Not connected to the server. Call `connect()` first.")
+        async with self._conn.create_process(term_type='xterm',
+                                             stdin=sys.stdin, stdout=sys.stdout,
+                                             stderr=sys.stdout) as proc:
+            await proc.wait()
+
+    async def close(self):
+        """
+        Closes the SSH connection and waits for it to shut down cleanly.
+
+        :return: None
+        """
+        if self._conn is not None:
+            self._conn.close()
+            await self._conn.wait_closed()
+            self._conn = None
+            print("🔒 SSH session closed.")